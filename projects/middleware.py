@@ -0,0 +1,74 @@
+import re
+
+import brotli
+from django.utils.cache import patch_vary_headers
+from django.utils.deprecation import MiddlewareMixin
+
+re_accepts_br = re.compile(r"\bbr\b")
+
+# Fast brotli level: most of the size win at a fraction of quality 11's CPU.
+BROTLI_QUALITY = 4
+
+
+def _compress_sequence(chunks):
+    """Brotli-compress a streamed body, emitting output as the compressor fills."""
+    compressor = brotli.Compressor(quality=BROTLI_QUALITY)
+    for chunk in chunks:
+        data = compressor.process(chunk)
+        if data:
+            yield data
+    yield compressor.finish()
+
+
+async def _acompress_sequence(chunks):
+    """Async counterpart of _compress_sequence() for async streamed bodies."""
+    compressor = brotli.Compressor(quality=BROTLI_QUALITY)
+    async for chunk in chunks:
+        data = compressor.process(chunk)
+        if data:
+            yield data
+    yield compressor.finish()
+
+
+class BrotliMiddleware(MiddlewareMixin):
+    """
+    Brotli-compress JSON API responses for clients that accept "br".
+    Must sit below GZipMiddleware in MIDDLEWARE so it sees the response first;
+    GZipMiddleware then skips anything that already has a Content-Encoding.
+    """
+
+    def process_response(self, request, response):
+        if not response.get("Content-Type", "").startswith("application/json"):
+            return response
+        # It's not worth attempting to compress really short responses.
+        if not response.streaming and len(response.content) < 200:
+            return response
+        if response.has_header("Content-Encoding"):
+            return response
+
+        patch_vary_headers(response, ("Accept-Encoding",))
+
+        ae = request.META.get("HTTP_ACCEPT_ENCODING", "")
+        if not re_accepts_br.search(ae):
+            return response
+
+        if response.streaming:
+            if response.is_async:
+                response.streaming_content = _acompress_sequence(response.streaming_content)
+            else:
+                response.streaming_content = _compress_sequence(response.streaming_content)
+            del response.headers["Content-Length"]
+        else:
+            compressed_content = brotli.compress(response.content, quality=BROTLI_QUALITY)
+            if len(compressed_content) >= len(response.content):
+                return response
+            response.content = compressed_content
+            response.headers["Content-Length"] = str(len(response.content))
+
+        # A compressed body is no longer byte-identical, so weaken a strong ETag.
+        etag = response.get("ETag")
+        if etag and etag.startswith('"'):
+            response.headers["ETag"] = "W/" + etag
+        response.headers["Content-Encoding"] = "br"
+
+        return response
@@ -0,0 +1,21 @@
+# Generated by Django 5.0.6 on 2026-10-15 02:47
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('projects', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='project',
+            index=models.Index(fields=['-priority', 'name'], name='projects_pr_priorit_1862df_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='task',
+            index=models.Index(fields=['project', 'due_date'], name='projects_ta_project_6695a1_idx'),
+        ),
+    ]
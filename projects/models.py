@@ -9,6 +9,11 @@ class Project(models.Model):
     start_date = models.DateField()
     active = models.BooleanField(default=True)
     priority = models.IntegerField(default=1)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        # Matches the list endpoint's ORDER BY -priority, name.
+        indexes = [models.Index(fields=["-priority", "name"])]
 
     def __str__(self) -> str:
         """Return a readable representation for admin/debug."""
@@ -26,6 +31,11 @@ class Task(models.Model):
     due_date = models.DateField()
     completed = models.BooleanField(default=False)
     estimate_hours = models.IntegerField(default=1)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        # Matches WHERE project_id = ? ORDER BY due_date on task listings.
+        indexes = [models.Index(fields=["project", "due_date"])]
 
     def __str__(self) -> str:
         """Return a readable representation for admin/debug."""
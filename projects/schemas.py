@@ -0,0 +1,37 @@
+from datetime import date
+from typing import Annotated
+
+import msgspec
+
+# Upper bound on projects per bulk request (one bulk_create batch).
+MAX_BULK_PROJECTS = 500
+
+# Values an IntegerField column can store (SQLite integers are 64-bit); larger
+# ints would fail in the database driver instead of as a 400.
+DbInt = Annotated[int, msgspec.Meta(ge=-2**63, le=2**63 - 1)]
+
+
+class ProjectIn(msgspec.Struct):
+    """Request body for creating a project."""
+
+    name: Annotated[str, msgspec.Meta(max_length=120)]
+    start_date: date
+    active: bool
+    priority: DbInt
+    description: str = ""
+
+
+class ProjectsIn(msgspec.Struct):
+    """Request body for creating many projects at once."""
+
+    projects: Annotated[list[ProjectIn], msgspec.Meta(max_length=MAX_BULK_PROJECTS)]
+
+
+class TaskIn(msgspec.Struct):
+    """Request body for creating a task under a project."""
+
+    title: Annotated[str, msgspec.Meta(max_length=200)]
+    due_date: date
+    completed: bool
+    estimate_hours: DbInt
+    notes: str = ""
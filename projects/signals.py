@@ -0,0 +1,47 @@
+import time
+
+from django.core.cache import cache
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from .models import Project
+
+# Cached project-list pages are keyed by this generation. A missing key is
+# seeded from the clock so a cache flush can never revive an old generation.
+PROJECTS_GENERATION_KEY = "projects:generation"
+
+
+async def aprojects_generation() -> int:
+    """Return the current project-list generation, seeding it if missing."""
+    await cache.aadd(PROJECTS_GENERATION_KEY, time.time_ns(), timeout=None)
+    return await cache.aget(PROJECTS_GENERATION_KEY)
+
+
+def invalidate_projects() -> None:
+    """Drop every cached project-list page by moving to a new generation."""
+    try:
+        cache.incr(PROJECTS_GENERATION_KEY)
+    except ValueError:
+        cache.set(PROJECTS_GENERATION_KEY, time.time_ns(), timeout=None)
+
+
+async def ainvalidate_projects() -> None:
+    """Async counterpart of invalidate_projects()."""
+    try:
+        await cache.aincr(PROJECTS_GENERATION_KEY)
+    except ValueError:
+        await cache.aset(PROJECTS_GENERATION_KEY, time.time_ns(), timeout=None)
+
+
+# Invalidation waits for commit so a reader can't cache pre-commit rows under
+# the new generation. Covers the API, the admin and shell edits alike;
+# queryset update()/bulk_create() send no signals and invalidate explicitly.
+@receiver(post_save, sender=Project)
+def _project_saved(sender, instance, **kwargs):
+    transaction.on_commit(invalidate_projects)
+
+
+@receiver(post_delete, sender=Project)
+def _project_deleted(sender, instance, **kwargs):
+    transaction.on_commit(invalidate_projects)
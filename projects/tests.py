@@ -1,3 +1,301 @@
-from django.test import TestCase
+import json
+from datetime import date
 
-# Create your tests here.
+import brotli
+from asgiref.sync import sync_to_async
+from django.core.cache import cache
+from django.test import TransactionTestCase
+
+from .models import Project, Task
+from .schemas import MAX_BULK_PROJECTS
+
+
+def _project(name: str, priority: int = 1) -> dict:
+    """Build a valid create payload for a project."""
+    return {"name": name, "description": "", "start_date": "2025-01-01", "active": True, "priority": priority}
+
+
+class ApiTestCase(TransactionTestCase):
+    """
+    Base class for the JSON API tests.
+    TransactionTestCase so transaction.on_commit() cache invalidation runs
+    exactly as it does outside tests.
+    """
+
+    def setUp(self):
+        cache.clear()
+
+    async def get_json(self, path: str, data=None, **extra):
+        """GET path and return (response, decoded body); handles streamed bodies."""
+        response = await self.async_client.get(path, data, **extra)
+        if response.streaming:
+            body = b"".join([chunk async for chunk in response.streaming_content])
+        else:
+            body = response.content
+        return response, json.loads(body) if body else None
+
+    async def send_json(self, method: str, path: str, payload):
+        """Send payload as a JSON body with the given method and return the response."""
+        send = getattr(self.async_client, method)
+        return await send(path, json.dumps(payload), content_type="application/json")
+
+
+class CreateTests(ApiTestCase):
+    async def test_rejects_out_of_range_priority(self):
+        response = await self.send_json("post", "/api/projects/", _project("a", priority=2**70))
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(await Project.objects.acount(), 0)
+
+    async def test_rejects_out_of_range_estimate(self):
+        project = await Project.objects.acreate(name="a", start_date=date(2025, 1, 1))
+        payload = {"title": "t", "due_date": "2025-01-01", "completed": False, "estimate_hours": -2**64}
+        response = await self.send_json("post", f"/api/projects/{project.id}/tasks/", payload)
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(await Task.objects.acount(), 0)
+
+
+class BulkCreateTests(ApiTestCase):
+    async def test_creates_all_projects(self):
+        response = await self.send_json("post", "/api/projects/bulk/", {"projects": [_project("a"), _project("b")]})
+        self.assertEqual(response.status_code, 201)
+        self.assertEqual([p["name"] for p in json.loads(response.content)["projects"]], ["a", "b"])
+        self.assertEqual(await Project.objects.acount(), 2)
+
+    async def test_rejects_invalid_item(self):
+        response = await self.send_json("post", "/api/projects/bulk/", {"projects": [_project("a"), {"name": "b"}]})
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(await Project.objects.acount(), 0)
+
+    async def test_rejects_too_many_items(self):
+        payload = {"projects": [_project(f"p{i}") for i in range(MAX_BULK_PROJECTS + 1)]}
+        response = await self.send_json("post", "/api/projects/bulk/", payload)
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(await Project.objects.acount(), 0)
+
+
+class PaginationTests(ApiTestCase):
+    def setUp(self):
+        super().setUp()
+        # Repeated priorities and names exercise every keyset tiebreaker.
+        self.projects = [
+            Project.objects.create(name=f"p,{i % 3}", start_date=date(2025, 1, 1), priority=i % 2)
+            for i in range(7)
+        ]
+        self.project = self.projects[0]
+        for i in range(5):
+            Task.objects.create(project=self.project, title="t", due_date=date(2025, 1, 1 + i % 2))
+
+    async def collect(self, path: str, key: str, limit: int = 2) -> list:
+        """Follow next_cursor from the first page and return every id seen."""
+        ids, cursor = [], None
+        while True:
+            params = {"limit": limit} if cursor is None else {"limit": limit, "cursor": cursor}
+            response, data = await self.get_json(path, params)
+            self.assertEqual(response.status_code, 200)
+            ids += [row["id"] for row in data[key]]
+            cursor = data["next_cursor"]
+            if cursor is None:
+                return ids
+
+    async def test_project_pages_match_full_listing(self):
+        _, full = await self.get_json("/api/projects/", {"limit": 100})
+        ids = await self.collect("/api/projects/", "projects")
+        self.assertEqual(ids, [row["id"] for row in full["projects"]])
+        self.assertEqual(len(ids), 7)
+
+    async def test_task_pages_match_full_listing(self):
+        path = f"/api/projects/{self.project.id}/tasks/"
+        _, full = await self.get_json(path, {"limit": 100})
+        ids = await self.collect(path, "tasks")
+        self.assertEqual(ids, [row["id"] for row in full["tasks"]])
+        self.assertEqual(len(ids), 5)
+
+    async def test_cursor_survives_deleted_row(self):
+        _, first = await self.get_json("/api/projects/", {"limit": 2})
+        await Project.objects.filter(pk=first["projects"][-1]["id"]).adelete()
+        response, second = await self.get_json("/api/projects/", {"limit": 2, "cursor": first["next_cursor"]})
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(len(second["projects"]), 2)
+
+    async def test_invalid_cursor_is_rejected(self):
+        response, data = await self.get_json("/api/projects/", {"cursor": "not-a-cursor"})
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(data, {"error": "Invalid cursor."})
+
+
+class ConditionalGetAndCacheTests(ApiTestCase):
+    def setUp(self):
+        super().setUp()
+        self.project = Project.objects.create(name="a", start_date=date(2025, 1, 1))
+
+    async def test_if_none_match_returns_304(self):
+        response, _ = await self.get_json("/api/projects/")
+        etag = response["ETag"]
+        response = await self.async_client.get("/api/projects/", headers={"if-none-match": etag})
+        self.assertEqual(response.status_code, 304)
+
+    async def test_equivalent_queries_share_cache_entry(self):
+        first, _ = await self.get_json("/api/projects/")
+        response, _ = await self.get_json("/api/projects/", {"junk": "1", "limit": 50})
+        self.assertEqual(response["ETag"], first["ETag"])
+        self.assertFalse(response.streaming)  # served from the cached bytes
+
+    async def test_api_update_invalidates_cache(self):
+        first, _ = await self.get_json("/api/projects/")
+        await self.send_json("put", f"/api/projects/{self.project.id}/", {"name": "renamed"})
+        response, data = await self.get_json("/api/projects/")
+        self.assertNotEqual(response["ETag"], first["ETag"])
+        self.assertEqual(data["projects"][0]["name"], "renamed")
+
+    async def test_model_save_invalidates_cache(self):
+        first, _ = await self.get_json("/api/projects/")
+        self.project.name = "renamed"
+        await sync_to_async(self.project.save)()
+        response, data = await self.get_json("/api/projects/")
+        self.assertNotEqual(response["ETag"], first["ETag"])
+        self.assertEqual(data["projects"][0]["name"], "renamed")
+
+    async def test_delete_invalidates_cache(self):
+        await self.get_json("/api/projects/")
+        response = await self.async_client.delete(f"/api/projects/{self.project.id}/")
+        self.assertEqual(response.status_code, 204)
+        _, data = await self.get_json("/api/projects/")
+        self.assertEqual(data["projects"], [])
+
+    async def test_bulk_create_invalidates_cache(self):
+        await self.get_json("/api/projects/")
+        await self.send_json("post", "/api/projects/bulk/", {"projects": [_project("b")]})
+        _, data = await self.get_json("/api/projects/")
+        self.assertEqual(sorted(p["name"] for p in data["projects"]), ["a", "b"])
+
+
+class ProjectResourceTests(ApiTestCase):
+    def setUp(self):
+        super().setUp()
+        self.project = Project.objects.create(name="a", start_date=date(2025, 1, 1), priority=1)
+        self.path = f"/api/projects/{self.project.id}/"
+
+    async def test_put_updates_given_fields(self):
+        response = await self.send_json("put", self.path, {"name": "b", "priority": "3"})
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(json.loads(response.content)["project"]["priority"], 3)
+        project = await Project.objects.aget(pk=self.project.id)
+        self.assertEqual((project.name, project.priority, project.description), ("b", 3, ""))
+        self.assertGreater(project.updated_at, self.project.updated_at)
+
+    async def test_put_rejects_wrongly_typed_values(self):
+        for payload in ({"priority": None}, {"start_date": 12}, {"start_date": "soon"}, {"priority": 2**70}):
+            with self.subTest(payload=payload):
+                response = await self.send_json("put", self.path, payload)
+                self.assertEqual(response.status_code, 400)
+        project = await Project.objects.aget(pk=self.project.id)
+        self.assertEqual(project.updated_at, self.project.updated_at)
+
+    async def test_put_ignores_non_object_body(self):
+        response = await self.send_json("put", self.path, ["name", "b"])
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(json.loads(response.content)["project"]["name"], "a")
+
+    async def test_put_missing_project_is_404(self):
+        response = await self.send_json("put", "/api/projects/999/", {"name": "b"})
+        self.assertEqual(response.status_code, 404)
+
+    async def test_delete_removes_project_and_tasks(self):
+        await Task.objects.acreate(project=self.project, title="t", due_date=date(2025, 1, 1))
+        response = await self.async_client.delete(self.path)
+        self.assertEqual(response.status_code, 204)
+        self.assertFalse(await Project.objects.filter(pk=self.project.id).aexists())
+        self.assertEqual(await Task.objects.acount(), 0)
+
+    async def test_delete_missing_project_is_404(self):
+        response = await self.async_client.delete("/api/projects/999/")
+        self.assertEqual(response.status_code, 404)
+
+
+class TaskResourceTests(ApiTestCase):
+    def setUp(self):
+        super().setUp()
+        project = Project.objects.create(name="a", start_date=date(2025, 1, 1))
+        self.task = Task.objects.create(project=project, title="t", due_date=date(2025, 1, 1))
+        self.path = f"/api/tasks/{self.task.id}/"
+
+    async def test_put_updates_given_fields(self):
+        response = await self.send_json("put", self.path, {"completed": True, "due_date": "2025-02-01"})
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(json.loads(response.content)["task"]["due_date"], "2025-02-01")
+        task = await Task.objects.aget(pk=self.task.id)
+        self.assertEqual((task.title, task.completed, task.due_date), ("t", True, date(2025, 2, 1)))
+        self.assertGreater(task.updated_at, self.task.updated_at)
+
+    async def test_put_rejects_wrongly_typed_values(self):
+        for payload in ({"estimate_hours": None}, {"due_date": 12}, {"estimate_hours": "many"}):
+            with self.subTest(payload=payload):
+                response = await self.send_json("put", self.path, payload)
+                self.assertEqual(response.status_code, 400)
+        task = await Task.objects.aget(pk=self.task.id)
+        self.assertEqual(task.updated_at, self.task.updated_at)
+
+    async def test_put_missing_task_is_404(self):
+        response = await self.send_json("put", "/api/tasks/999/", {"title": "u"})
+        self.assertEqual(response.status_code, 404)
+
+    async def test_delete_removes_task(self):
+        response = await self.async_client.delete(self.path)
+        self.assertEqual(response.status_code, 204)
+        self.assertEqual(await Task.objects.acount(), 0)
+
+    async def test_delete_missing_task_is_404(self):
+        response = await self.async_client.delete("/api/tasks/999/")
+        self.assertEqual(response.status_code, 404)
+
+
+class BrotliMiddlewareTests(ApiTestCase):
+    def setUp(self):
+        super().setUp()
+        self.projects = [Project.objects.create(name=f"p{i}", start_date=date(2025, 1, 1)) for i in range(31)]
+
+    async def get_br(self, path: str):
+        """GET path accepting brotli and return (response, raw body bytes)."""
+        response = await self.async_client.get(path, headers={"accept-encoding": "gzip, br"})
+        if response.streaming:
+            return response, b"".join([chunk async for chunk in response.streaming_content])
+        return response, response.content
+
+    async def test_streamed_page_is_compressed(self):
+        response, body = await self.get_br("/api/projects/")
+        self.assertTrue(response.streaming)
+        self.assertEqual(response["Content-Encoding"], "br")
+        self.assertFalse(response.has_header("Content-Length"))
+        self.assertEqual(len(json.loads(brotli.decompress(body))["projects"]), 31)
+        # Not flushed per row: about as small as compressing the whole body.
+        _, cached = await self.get_br("/api/projects/")
+        self.assertLessEqual(len(body), len(cached) + 16)
+
+    async def test_cached_page_is_compressed(self):
+        await self.get_br("/api/projects/")
+        response, body = await self.get_br("/api/projects/")
+        self.assertFalse(response.streaming)
+        self.assertEqual(response["Content-Encoding"], "br")
+        self.assertEqual(response["Content-Length"], str(len(body)))
+        self.assertIn("Accept-Encoding", response["Vary"])
+        self.assertTrue(response["ETag"].startswith('W/"'))
+        self.assertEqual(len(json.loads(brotli.decompress(body))["projects"]), 31)
+
+    async def test_weak_etag_still_matches(self):
+        response, _ = await self.get_br("/api/projects/")
+        response = await self.async_client.get(
+            "/api/projects/", headers={"accept-encoding": "br", "if-none-match": response["ETag"]}
+        )
+        self.assertEqual(response.status_code, 304)
+
+    async def test_skips_clients_without_br(self):
+        response = await self.async_client.get("/api/projects/", headers={"accept-encoding": "identity"})
+        self.assertFalse(response.has_header("Content-Encoding"))
+        self.assertIn("Accept-Encoding", response["Vary"])
+        self.assertTrue(response["ETag"].startswith('"'))
+
+    async def test_skips_short_bodies(self):
+        response, body = await self.get_br(f"/api/projects/{self.projects[0].id}/")
+        self.assertLess(len(body), 200)
+        self.assertFalse(response.has_header("Content-Encoding"))
+        self.assertEqual(json.loads(body)["project"]["name"], "p0")
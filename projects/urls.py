@@ -5,6 +5,7 @@ urlpatterns = [
     path("", views.index, name="index"),
 
     path("api/projects/", views.projects_collection, name="projects_collection"),
+    path("api/projects/bulk/", views.projects_bulk, name="projects_bulk"),
     path("api/projects/<int:project_id>/", views.project_resource, name="project_resource"),
     path("api/projects/<int:project_id>/tasks/", views.project_tasks_collection, name="project_tasks_collection"),
 